@@ -1,3 +1,10 @@
+import io
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    from xml.etree import ElementTree as ET
+
 # API-specific variables
 API_URL = 'https://api1.example.com/endpoint'
 METHOD = 'POST'
@@ -20,25 +27,44 @@ AUTH = {
 def preprocess_body(body):
     # Add API-specific pre-processing logic here
     # For example, you might want to add a timestamp to the XML
-    from xml.etree import ElementTree as ET
     from datetime import datetime
 
-    root = ET.fromstring(body)
-    timestamp = ET.SubElement(root, 'timestamp')
-    timestamp.text = datetime.now().isoformat()
-    return ET.tostring(root, encoding='unicode')
+    now = datetime.now().isoformat()
+    timestamp = f"<timestamp>{now}</timestamp>"
+    # Splice the element in before the closing root tag rather than parsing and re-serializing
+    close_idx = body.rfind('</')
+    if close_idx == -1:
+        # lxml rejects str input carrying an encoding declaration, so parse bytes
+        root = ET.fromstring(body.encode() if isinstance(body, str) else body)
+        ET.SubElement(root, 'timestamp').text = now
+        return ET.tostring(root, encoding='unicode')
+    return body[:close_idx] + timestamp + body[close_idx:]
 
 # API-specific post-processing
 def postprocess_response(response):
     # Add API-specific post-processing logic here
     # For example, you might want to extract certain data from the XML response
-    from xml.etree import ElementTree as ET
 
     if response.headers.get('Content-Type') == 'application/xml':
-        root = ET.fromstring(response.text)
-        # Extract specific data from the XML
-        # For example:
-        # status = root.find('status').text
-        # return {'status': status}
+        # Parse incrementally from the raw stream when the body hasn't been read yet
+        # (request with stream=True) so memory stays bounded
+        if getattr(response, '_content_consumed', True):
+            source = io.BytesIO(response.content)
+        else:
+            response.raw.decode_content = True
+            source = response.raw
+        status = None
+        try:
+            for event, elem in ET.iterparse(source, events=('end',)):
+                if elem.tag == 'status':
+                    status = elem.text
+                    break
+                elem.clear()
+                # lxml keeps processed siblings attached to the parent, so drop them too
+                if hasattr(elem, 'getprevious'):
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+        finally:
+            response.close()
+        return {'status': status}
     return response.text
-
@@ -1,5 +1,26 @@
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+# Shared session so repeated calls reuse keep-alive connections
+_SESSION = None
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        _SESSION.mount('http://', adapter)
+        _SESSION.mount('https://', adapter)
+    return _SESSION
+
+def close():
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
 
 def get_auth_instance(auth):
     if not auth:
@@ -11,7 +32,7 @@ def get_auth_instance(auth):
     # Add other auth types if needed
     return None
 
-def make_api_request(url, method, params=None, headers=None, body=None, auth=None, proxy=None):
+def make_api_request(url, method, params=None, headers=None, body=None, auth=None, proxy=None, stream=False):
     method = method.lower()
     auth_instance = get_auth_instance(auth)
 
@@ -23,7 +44,7 @@ def make_api_request(url, method, params=None, headers=None, body=None, auth=Non
         json = None
 
     try:
-        response = requests.request(method, url, params=params, headers=headers, data=data, json=json, auth=auth_instance, proxies=proxy)
+        response = _get_session().request(method, url, params=params, headers=headers, data=data, json=json, auth=auth_instance, proxies=proxy, stream=stream)
         response.raise_for_status()  # Raise an exception for HTTP errors
         return response
     except requests.RequestException as e:
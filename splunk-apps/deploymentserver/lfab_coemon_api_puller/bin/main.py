@@ -1,43 +1,69 @@
+import copy
 import json
+import functools
 import yaml
 import time
 import os
 import sys
 import logging
-from datetime import datetime, timedelta
 from utils.logger import setup_logger
-from utils.api_handler import APIHandler
+from utils.api_handler import APIHandler, normalize_api_config
 from utils.oauth_handler import OAuthHandler
 from utils.processor_registry import registry as processor_registry
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from utils.processors import register_processors
 register_processors(processor_registry)
 
+logger = logging.getLogger(__name__)
+
+# Number of threads used to delete old log files
+CLEANUP_MAX_WORKERS = 8
+
+# Prefer the libyaml C bindings; the pure-Python loader/dumper is much slower
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    YAML_C_EXTENSION = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    YAML_C_EXTENSION = False
+
+@functools.lru_cache(maxsize=32)
+def _load_config_raw(config_file, mtime_ns):
+    """
+    Parse a configuration file. Cached by load_config on (path, mtime) so
+    repeated loads of an unchanged file skip re-parsing.
+    """
+    file_ext = os.path.splitext(config_file)[1].lower()
+    
+    with open(config_file, 'r') as f:
+        if file_ext in ['.yaml', '.yml']:
+            # Load YAML configuration
+            try:
+                return yaml.load(f, Loader=SafeLoader)
+            except yaml.YAMLError as e:
+                logger.error("Failed to parse YAML configuration: %s", e)
+                sys.exit(1)
+        else:
+            # Default to JSON
+            try:
+                return json.load(f)
+            except json.JSONDecodeError as e:
+                logger.error("Failed to parse JSON configuration: %s", e)
+                sys.exit(1)
+
 def load_config(config_file):
     """
     Load the configuration file that specifies API details and auth type.
     Supports both JSON and YAML formats.
+    
+    Returns a deep copy of the cached parse, since callers normalize it in place.
     """
     try:
-        file_ext = os.path.splitext(config_file)[1].lower()
-        
-        with open(config_file, 'r') as f:
-            if file_ext in ['.yaml', '.yml']:
-                # Load YAML configuration
-                try:
-                    return yaml.safe_load(f)
-                except yaml.YAMLError as e:
-                    logging.error(f"Failed to parse YAML configuration: {str(e)}")
-                    sys.exit(1)
-            else:
-                # Default to JSON
-                try:
-                    return json.load(f)
-                except json.JSONDecodeError as e:
-                    logging.error(f"Failed to parse JSON configuration: {str(e)}")
-                    sys.exit(1)
+        config_path = os.path.abspath(config_file)
+        return copy.deepcopy(_load_config_raw(config_path, os.stat(config_path).st_mtime_ns))
     except Exception as e:
-        logging.error(f"Failed to load configuration: {str(e)}")
+        logger.error("Failed to load configuration: %s", e)
         sys.exit(1)
 
 def save_config(config, filename):
@@ -53,13 +79,13 @@ def save_config(config, filename):
         
         with open(filename, 'w') as f:
             if file_ext in ['.yaml', '.yml']:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-                logging.info(f"Configuration saved to {filename} in YAML format")
+                yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+                logger.info("Configuration saved to %s in YAML format", filename)
             else:
                 json.dump(config, f, indent=2)
-                logging.info(f"Configuration saved to {filename} in JSON format")
+                logger.info("Configuration saved to %s in JSON format", filename)
     except Exception as e:
-        logging.error(f"Failed to save configuration: {str(e)}")
+        logger.error("Failed to save configuration: %s", e)
 
 def json_to_yaml(json_file, yaml_file=None):
     """
@@ -76,21 +102,30 @@ def json_to_yaml(json_file, yaml_file=None):
         config = load_config(json_file)
         save_config(config, yaml_file)
     except Exception as e:
-        logging.error(f"Failed to convert JSON to YAML: {str(e)}")
+        logger.error("Failed to convert JSON to YAML: %s", e)
+
+def _remove_file(file_path):
+    """Delete a single file, logging rather than raising on failure."""
+    try:
+        os.remove(file_path)
+        logger.info("Deleted old file: %s", file_path)
+    except OSError as e:
+        logger.error("Failed to delete %s: %s", file_path, e)
 
 def cleanup_old_files(directory, days=7):
     """Delete files older than the specified number of days."""
-    now = datetime.now()
-    for filename in os.listdir(directory):
-        file_path = os.path.join(directory, filename)
-        if os.path.isfile(file_path):
-            file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-            if now - file_time > timedelta(days=days):
-                try:
-                    os.remove(file_path)
-                    logging.info(f"Deleted old file: {file_path}")
-                except Exception as e:
-                    logging.error(f"Failed to delete {file_path}: {str(e)}")
+    cutoff_ts = time.time() - days * 86400
+    
+    # Collect stale files first so the directory isn't modified while scanning it
+    with os.scandir(directory) as entries:
+        stale_paths = [
+            entry.path for entry in entries
+            if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff_ts
+        ]
+    
+    # Unlinks are independent and I/O-bound, so overlap them across a small thread pool
+    with ThreadPoolExecutor(max_workers=CLEANUP_MAX_WORKERS) as executor:
+        list(executor.map(_remove_file, stale_paths))
 
 def main():
     # Parse command line arguments
@@ -108,11 +143,23 @@ def main():
     # Setup logging
     log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
     os.makedirs(log_dir, exist_ok=True)
-    logger = setup_logger(log_dir)
+    setup_logger(log_dir)
+    
+    if not YAML_C_EXTENSION:
+        logger.warning("PyYAML libyaml bindings not available, using the slower pure-Python YAML parser")
     
     # Load the specified configuration file
     config = load_config(args.config)
     
+    # Normalize processor specs once so API calls don't re-inspect them on every poll
+    for api in config.get("single_apis", []):
+        normalize_api_config(api)
+    for api_pair in config.get("nested_apis", []):
+        if isinstance(api_pair, dict) and "parent_api" in api_pair and "child_apis" in api_pair:
+            normalize_api_config(api_pair["parent_api"])
+            for child_api in api_pair["child_apis"]:
+                normalize_api_config(child_api)
+    
     # Load custom processors if specified
     #if args.processors:
     #    processor_path = os.path.abspath(args.processors)
@@ -138,7 +185,7 @@ def main():
             verify=oauth_config.get("verify", True)
         )
     else:
-        logging.error(f"Unsupported authentication type: {auth_type}")
+        logger.error("Unsupported authentication type: %s", auth_type)
         sys.exit(1)
     
     # Initialize API handler
@@ -168,7 +215,7 @@ def main():
         cleanup_old_files(log_dir, days=cleanup_days)
         
     except Exception as e:
-        logging.error(f"Error during API operations: {str(e)}")
+        logger.error("Error during API operations: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -1,13 +1,106 @@
 import requests
-import json
+import atexit
+import collections
 import logging
 import os
-from datetime import datetime
+import re
+import itertools
+import tempfile
 import time
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from utils.json_utils import json_dumps_bytes, json_dumps_indented, json_loads
+from utils.logger import fast_timestamp
 from utils.processor_registry import registry
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Warning filters are process-wide, so install this one once at import time
+requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional; without it stream_path is ignored and responses are buffered
+    ijson = None
+
+def _spool_items(items, spool):
+    """
+    Yield items unchanged while writing each one to a spool file as a JSON line.
+    
+    Args:
+        items: Iterator of JSON-serializable items
+        spool: Binary file object the items are written to
+    """
+    for item in items:
+        spool.write(json_dumps_bytes(item) + b'\n')
+        yield item
+
+# Matches {placeholder} tokens in child API URLs
+_PLACEHOLDER_RE = re.compile(r'\{([^{}]+)\}')
+
+# Appended to error filenames so responses saved within the same second don't collide
+_error_file_counter = itertools.count()
+
+# Maximum concurrent child API calls in call_nested_apis (kept within the session pool size)
+NESTED_MAX_WORKERS = 16
+
+# Number of buffered response records written before all response files are flushed
+RESPONSE_FLUSH_INTERVAL = 100
+
+# Maximum response files kept open at once; the least recently used are closed beyond this
+MAX_OPEN_RESPONSE_WRITERS = 32
+
+# Processor config keys and the normalized (name, args) keys they map to
+_PROCESSOR_SPEC_KEYS = (("preprocess", "_preprocess"), ("postprocess", "_postprocess"), ("output", "_output"))
+
+def normalize_api_config(api_config):
+    """
+    Convert processor specs on an API config into (name, args) tuples.
+    
+    Stores _preprocess, _postprocess and _output on the config (None when not
+    configured), so repeated calls don't re-inspect the raw processor dicts.
+    
+    Args:
+        api_config: API configuration dictionary
+    """
+    if "_output" in api_config:
+        return
+    
+    for config_key, normalized_key in _PROCESSOR_SPEC_KEYS:
+        spec = api_config.get(config_key)
+        if isinstance(spec, dict) and spec.get("name"):
+            api_config[normalized_key] = (spec["name"], spec.get("args", {}))
+        else:
+            api_config[normalized_key] = None
+
+class _RateLimiter:
+    """Space out call start times by a fixed interval across threads."""
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until this caller's slot is reached."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
 
 class APIHandler:
+    # Sessions shared across handler instances, keyed by (proxy, verify, id(auth_handler))
+    _SESSIONS = {}
+    _sessions_lock = threading.Lock()
+    
     def __init__(self, auth_handler, verify, proxy=None):
         """
         Initialize the API Handler with authentication details and proxy settings.
@@ -20,12 +113,51 @@ class APIHandler:
         self.auth_handler = auth_handler
         self.proxies = {"http": proxy, "https": proxy} if proxy else None
         self.verify = verify
-        requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
-        self.session = requests.Session()
         
+        # Resolve and create the response log directory once
+        self._log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
+        os.makedirs(self._log_dir, exist_ok=True)
+        
+        # Buffered JSON-lines writers for successful responses, keyed by endpoint name
+        # and ordered from least to most recently used
+        self._writers = collections.OrderedDict()
+        self._pending_writes = 0
+        self._writer_lock = threading.Lock()
+        atexit.register(self.close)
+        
+        # Share one pooled session between handlers with the same proxy, SSL settings and
+        # credentials; the session's cookie jar must not carry cookies across credentials.
+        # The auth handler is stored with its session so its id can't be reused by another.
+        session_key = (proxy, verify, id(auth_handler))
+        with APIHandler._sessions_lock:
+            if session_key not in APIHandler._SESSIONS:
+                APIHandler._SESSIONS[session_key] = (auth_handler, self._make_session())
+            self.session = APIHandler._SESSIONS[session_key][1]
+    
+    @staticmethod
+    def _make_session():
+        """Create a session with a connection pool sized for nested API fan-out and retries for transient failures."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                backoff_factor=0.5,
+                allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+                raise_on_status=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'Content-Type': 'application/json'})
+        return session
+    
     def _prepare_headers(self):
         """Prepare request headers based on authentication type."""
-        headers = {'Content-Type': 'application/json'}
+        # Content-Type is set once on the session
+        headers = {}
         
         if isinstance(self.auth_handler, dict):
             auth_type = self.auth_handler.get("type", "").lower()
@@ -53,27 +185,25 @@ class APIHandler:
         """
         Save processed API response to file.
         
+        Successful responses are appended to a daily JSON-lines file per endpoint;
+        error responses are written to their own file.
+        
         Args:
             endpoint: API endpoint URL
             response_data: Processed response data to save
             is_error: Whether this is an error response
             status_code: HTTP status code (for error responses)
         """
-        # Create logs directory if it doesn't exist
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # Create a filename based on the endpoint and timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         endpoint_name = endpoint.split('/')[-1].replace('?', '_').replace('&', '_')
         
-        # Determine file path based on whether it's an error
-        if is_error:
-            filename = f"error_{endpoint_name}_{timestamp}.log"
-        else:
-            filename = f"{endpoint_name}_{timestamp}.log"
-            
-        file_path = os.path.join(log_dir, filename)
+        if not is_error:
+            self._append_response(endpoint, endpoint_name, response_data)
+            return
+        
+        # Create a filename based on the endpoint and timestamp
+        timestamp = fast_timestamp()
+        filename = f"error_{endpoint_name}_{timestamp}_{next(_error_file_counter)}.log"
+        file_path = os.path.join(self._log_dir, filename)
         
         try:
             # Save to file, handling different types of response data
@@ -88,7 +218,7 @@ class APIHandler:
                         f.write("\n".join(response_data["__split_json_output"]))
                     else:
                         # Regular JSON object
-                        json.dump(response_data, f, indent=2)
+                        f.write(json_dumps_indented(response_data))
                 elif isinstance(response_data, str):
                     # String output
                     f.write(response_data)
@@ -100,15 +230,132 @@ class APIHandler:
                     # Fallback: convert to string
                     f.write(str(response_data))
                     
-            logging.info(f"{'Error ' if is_error else ''}Response from {endpoint} saved to {file_path}")
+            logger.info("%sResponse from %s saved to %s", 'Error ' if is_error else '', endpoint, file_path)
+            
+        except Exception as e:
+            logger.error("Failed to save %sresponse from %s: %s", 'error ' if is_error else '', endpoint, e)
+    
+    def _append_response(self, endpoint, endpoint_name, response_data):
+        """
+        Append a successful response to the endpoint's daily JSON-lines file.
+        
+        Args:
+            endpoint: API endpoint URL
+            endpoint_name: Sanitized endpoint name used for the filename
+            response_data: Processed response data to save
+        """
+        # Serialize the record, handling different types of response data
+        if isinstance(response_data, dict) and "__flatten_json_output" in response_data:
+            # Direct string output from flatten_json processor
+            record = response_data["__flatten_json_output"].encode()
+        elif isinstance(response_data, dict) and "__split_json_output" in response_data:
+            # Multiple JSON lines from split_json_array processor
+            record = "\n".join(response_data["__split_json_output"]).encode()
+        elif isinstance(response_data, (dict, list)):
+            record = json_dumps_bytes(response_data)
+        else:
+            # Text bodies and scalars are stored as one JSON value so multi-line text can't break the file
+            try:
+                record = json_dumps_bytes(response_data)
+            except TypeError:
+                record = json_dumps_bytes(str(response_data))
+        
+        if not record:
+            return
+        
+        file_path = os.path.join(self._log_dir, f"{endpoint_name}_{fast_timestamp()[:8]}.jsonl")
+        
+        try:
+            with self._writer_lock:
+                writer = self._writers.get(endpoint_name)
+                if writer is None or writer.name != file_path:
+                    # First write for this endpoint, or the day rolled over
+                    if writer is not None:
+                        writer.close()
+                    writer = open(file_path, 'ab', buffering=1 << 16)
+                    self._writers[endpoint_name] = writer
+                    
+                    # Bound open file handles; nested fan-out can produce one endpoint name per item
+                    while len(self._writers) > MAX_OPEN_RESPONSE_WRITERS:
+                        _, evicted = self._writers.popitem(last=False)
+                        evicted.close()
+                self._writers.move_to_end(endpoint_name)
+                
+                writer.write(record + b'\n')
+                self._pending_writes += 1
+                if self._pending_writes >= RESPONSE_FLUSH_INTERVAL:
+                    for buffered_writer in self._writers.values():
+                        buffered_writer.flush()
+                    self._pending_writes = 0
+            
+            logger.info("Response from %s saved to %s", endpoint, file_path)
             
         except Exception as e:
-            logging.error(f"Failed to save {'error ' if is_error else ''}response from {endpoint}: {str(e)}")
+            logger.error("Failed to save response from %s: %s", endpoint, e)
+    
+    def flush(self):
+        """Flush buffered response files to disk."""
+        with self._writer_lock:
+            for writer in self._writers.values():
+                try:
+                    writer.flush()
+                except Exception as e:
+                    logger.error("Failed to flush response file %s: %s", writer.name, e)
+            self._pending_writes = 0
+    
+    def close(self):
+        """Flush and close buffered response files."""
+        with self._writer_lock:
+            for writer in self._writers.values():
+                try:
+                    writer.close()
+                except Exception as e:
+                    logger.error("Failed to close response file %s: %s", writer.name, e)
+            self._writers.clear()
+            self._pending_writes = 0
     
-    def call_single_api(self, api_config):
+    def _resolve_processors(self, api_config):
+        """
+        Look up the configured processor functions once and cache them on the API config.
+        
+        Args:
+            api_config: API configuration dictionary, updated with _pre_fn, _post_fn and _out_fn
+        """
+        if "_pre_fn" in api_config:
+            return
+        
+        normalize_api_config(api_config)
+        for spec_key, cache_key, lookup in (
+            ("_postprocess", "_post_fn", registry.get_postprocessor),
+            ("_output", "_out_fn", registry.get_output_processor),
+            ("_preprocess", "_pre_fn", registry.get_preprocessor),
+        ):
+            spec = api_config[spec_key]
+            api_config[cache_key] = lookup(spec[0]) if spec else None
+    
+    def call_single_api(self, api_config, url_override=None):
+        """
+        Call a single API endpoint with preprocessing, postprocessing, and save the response.
+        
+        Buffered response files are flushed before returning, so a process stopped
+        between runs (e.g. by SIGTERM, which skips atexit) loses no saved responses.
+        
+        Args:
+            api_config: API configuration dictionary (see _call_api)
+            url_override: URL to call instead of api_config["url"] (optional)
+        """
+        try:
+            return self._call_api(api_config, url_override)
+        finally:
+            self.flush()
+    
+    def _call_api(self, api_config, url_override=None, keep_items=False):
         """
         Call a single API endpoint with preprocessing, postprocessing, and save the response.
         
+        Streamed items are handed to the output processor lazily, so they are only
+        kept in memory when keep_items is set.
+        
         Args:
             api_config: Dictionary containing API configuration:
                 - url: API endpoint URL
@@ -121,18 +368,33 @@ class APIHandler:
                 - preprocess: Preprocessor configuration
                 - postprocess: Postprocessor configuration
                 - output: Output processor configuration
+                - stream_path: ijson prefix of array items to stream (optional)
+            url_override: URL to call instead of api_config["url"] (optional)
+            keep_items: Keep streamed items on the response as _stream_items (optional)
         """
+        self._resolve_processors(api_config)
+        
         # Apply preprocessor if configured
-        if "preprocess" in api_config and isinstance(api_config["preprocess"], dict):
-            preprocess_config = api_config["preprocess"]
-            preprocess_name = preprocess_config.get("name")
-            preprocess_args = preprocess_config.get("args", {})
+        preprocess_fn = api_config["_pre_fn"]
+        if preprocess_fn:
+            preprocess_name, preprocess_args = api_config["_preprocess"]
             
-            if preprocess_name:
-                logging.info(f"Running preprocessor: {preprocess_name}")
-                api_config = registry.run_preprocessor(preprocess_name, api_config, **preprocess_args)
+            # Give the preprocessor the resolved URL so its changes to it are kept
+            if url_override:
+                api_config = {**api_config, "url": url_override}
+                url_override = None
+            
+            logger.info("Running preprocessor: %s", preprocess_name)
+            try:
+                result = preprocess_fn(api_config, **preprocess_args)
+                if result is not None:
+                    api_config = result
+                    # Preprocessors may return a fresh dict without the cached processors
+                    self._resolve_processors(api_config)
+            except Exception as e:
+                logger.error("Error running preprocessor %s: %s", preprocess_name, e)
         
-        url = api_config.get("url")
+        url = url_override or api_config.get("url")
         method = api_config.get("method", "GET").upper()
         params = api_config.get("params", {})
         custom_headers = api_config.get("headers", {})
@@ -143,8 +405,14 @@ class APIHandler:
         headers = self._prepare_headers()
         headers.update(custom_headers)
         
+        # Stream large JSON array responses when a stream_path is configured and ijson is available
+        stream_path = api_config.get("stream_path")
+        stream = bool(stream_path) and ijson is not None
+        if stream_path and not stream:
+            logger.warning("ijson is not installed, reading %s without streaming", url)
+        
         try:
-            logging.info(f"Calling {method} {url}")
+            logger.info("Calling %s %s", method, url)
             
             response = self.session.request(
                 method=method,
@@ -155,11 +423,12 @@ class APIHandler:
                 auth=self._get_auth(),
                 proxies=self.proxies,
                 verify=verify,
-                timeout=30
+                timeout=30,
+                stream=stream
             )
             
             # Log the response status
-            logging.info(f"Response status: {response.status_code}")
+            logger.info("Response status: %s", response.status_code)
             
             # Save error responses separately
             if response.status_code >= 400:
@@ -169,58 +438,112 @@ class APIHandler:
             # Process the response if it was successful
             processed_data = None
             
-            try:
-                # First try to parse as JSON
-                response_data = response.json()
-                processed_data = response_data
-                
-                # Apply postprocessor if configured
-                if "postprocess" in api_config and isinstance(api_config["postprocess"], dict):
-                    postprocess_config = api_config["postprocess"]
-                    postprocess_name = postprocess_config.get("name")
-                    postprocess_args = postprocess_config.get("args", {})
+            if stream:
+                # Parse items at stream_path incrementally from the socket instead of buffering the body
+                if api_config["_postprocess"]:
+                    logger.warning("Skipping postprocessor for streamed response from %s", url)
+                try:
+                    response.raw.decode_content = True
+                    items = ijson.items(response.raw, stream_path, use_float=True)
+                    if keep_items:
+                        # The body can't be read again, so keep the items for the caller
+                        items = list(items)
+                        response._stream_items = items
+                    self._output_response(api_config, url, items)
+                finally:
+                    response.close()
+            else:
+                try:
+                    # First try to parse as JSON
+                    response_data = json_loads(response.content)
+                    processed_data = response_data
+                    # Let postprocessors reuse this parse instead of decoding the body again
+                    response._parsed_json = response_data
                     
-                    if postprocess_name:
-                        logging.info(f"Running postprocessor: {postprocess_name}")
-                        post_result = registry.run_postprocessor(postprocess_name, response, **postprocess_args)
+                    # Apply postprocessor if configured
+                    postprocess_fn = api_config["_post_fn"]
+                    if postprocess_fn:
+                        postprocess_name, postprocess_args = api_config["_postprocess"]
+                        
+                        logger.info("Running postprocessor: %s", postprocess_name)
+                        try:
+                            post_result = postprocess_fn(response, **postprocess_args)
+                        except Exception as e:
+                            logger.error("Error running postprocessor %s: %s", postprocess_name, e)
+                            post_result = None
                         
                         # Improved error handling
                         if post_result is not None:
                             processed_data = post_result
                         else:
                             # Handle failed postprocessor by using the original response data
-                            logging.warning(f"Postprocessor {postprocess_name} returned None or failed. Using original response data.")
-                            try:
-                                processed_data = response.json()  # Try to parse as JSON first
-                            except ValueError:
-                                processed_data = response.text  # Fall back to text if not JSON
-                
-            except ValueError:
-                # Not JSON, use text
-                processed_data = response.text
-            
-            # Apply output processor if configured
-            if "output" in api_config and isinstance(api_config["output"], dict):
-                output_config = api_config["output"]
-                output_name = output_config.get("name")
-                output_args = output_config.get("args", {})
+                            logger.warning("Postprocessor %s returned None or failed. Using original response data.", postprocess_name)
+                            processed_data = response_data  # Already parsed above, no need to re-parse
+                    
+                except ValueError:
+                    # Not JSON, use text
+                    processed_data = response.text
                 
-                if output_name:
-                    logging.info(f"Running output processor: {output_name}")
-                    success = registry.run_output_processor(output_name, processed_data, url, **output_args)
-                    if success:
-                        # If the output processor handled saving, we're done
-                        return response
-            
-            # Save the processed response using the default method
-            self._save_response(url, processed_data)
+                self._output_response(api_config, url, processed_data)
             
             return response
             
         except Exception as e:
-            logging.error(f"Error calling {url}: {str(e)}")
+            logger.error("Error calling %s: %s", url, e)
             return None
     
+    def _output_response(self, api_config, url, processed_data):
+        """
+        Run the configured output processor, falling back to saving the response.
+        
+        Args:
+            api_config: API configuration dictionary with resolved processors
+            url: API endpoint URL
+            processed_data: Processed response data, or an iterator of streamed items
+        """
+        # Apply output processor if configured
+        output_fn = api_config["_out_fn"]
+        if output_fn:
+            output_name, output_args = api_config["_output"]
+            
+            # Spool streamed items to disk as the output processor consumes them,
+            # so they can still be saved if it fails part-way through
+            spool = None
+            output_data = processed_data
+            if isinstance(processed_data, Iterator):
+                spool = tempfile.TemporaryFile()
+                output_data = _spool_items(processed_data, spool)
+            
+            try:
+                logger.info("Running output processor: %s", output_name)
+                try:
+                    success = output_fn(output_data, url, **output_args)
+                except Exception as e:
+                    logger.error("Error running output processor %s: %s", output_name, e)
+                    success = False
+                if success:
+                    # If the output processor handled saving, we're done
+                    return
+                
+                if spool is not None:
+                    # Spool whatever the processor left unread, then reload every item
+                    try:
+                        collections.deque(output_data, maxlen=0)
+                    except Exception as e:
+                        logger.error("Error reading streamed response from %s: %s", url, e)
+                    spool.seek(0)
+                    processed_data = [json_loads(line) for line in spool]
+            finally:
+                if spool is not None:
+                    spool.close()
+        
+        # The default writer serializes whole records, so collect any remaining streamed items
+        if isinstance(processed_data, Iterator):
+            processed_data = list(processed_data)
+        
+        # Save the processed response using the default method
+        self._save_response(url, processed_data)
+    
     def call_nested_apis(self, parent_api_config, child_api_configs):
         """
         Call a parent API, then call child APIs using values from the parent response.
@@ -230,24 +553,44 @@ class APIHandler:
         2. A single object with fields that can be used for URL substitution
         3. A nested structure where items_path points to a list or values
         
+        Args:
+            parent_api_config: Configuration for the parent API
+            child_api_configs: List of configurations for child APIs
+        """
+        try:
+            self._call_nested_apis(parent_api_config, child_api_configs)
+        finally:
+            self.flush()
+    
+    def _call_nested_apis(self, parent_api_config, child_api_configs):
+        """
+        Call a parent API and its child APIs without flushing response files.
+        
         Args:
             parent_api_config: Configuration for the parent API
             child_api_configs: List of configurations for child APIs
         """
         # Call the parent API
-        parent_response = self.call_single_api(parent_api_config)
+        parent_response = self._call_api(parent_api_config, keep_items=True)
         
         if not parent_response or parent_response.status_code >= 400:
-            logging.error(f"Failed to get response from parent API {parent_api_config.get('url')}")
+            logger.error("Failed to get response from parent API %s", parent_api_config.get('url'))
             return
         
         try:
-            parent_data = parent_response.json()
-            logging.error(f"Parent API response: {parent_data}.")
+            # A streamed body can't be re-read; its items at stream_path stand in for items_path
+            stream_items = getattr(parent_response, '_stream_items', None)
+            if stream_items is not None:
+                parent_data = None
+            else:
+                parent_data = json_loads(parent_response.content)
+            logger.error("Parent API response: %s.", parent_data)
             items_path = parent_api_config.get("items_path", "")
             
             # Determine how to process the parent response based on its structure and config
-            if items_path:
+            if stream_items is not None:
+                target_data = stream_items
+            elif items_path:
                 # Navigate to the specified path in the response
                 target_data = parent_data
                 for part in items_path.split('.'):
@@ -261,10 +604,10 @@ class APIHandler:
                         if 0 <= idx < len(target_data):
                             target_data = target_data[idx]
                         else:
-                            logging.error(f"Index {idx} out of range in items_path")
+                            logger.error("Index %s out of range in items_path", idx)
                             return
                     else:
-                        logging.error(f"Cannot find '{part}' in response at path '{items_path}'")
+                        logger.error("Cannot find '%s' in response at path '%s'", part, items_path)
                         return
             else:
                 # If no items_path is specified, use the entire response
@@ -274,73 +617,67 @@ class APIHandler:
             if isinstance(target_data, list):
                 # Case 1: Target is a list - process each item in the list
                 items_to_process = target_data
-                logging.info(f"Processing list of {len(items_to_process)} items from parent API")
+                logger.info("Processing list of %s items from parent API", len(items_to_process))
             elif isinstance(target_data, dict):
                 # Case 2: Target is a dictionary - use it as a single item
                 items_to_process = [target_data]
-                logging.info("Processing single dictionary item from parent API")
+                logger.info("Processing single dictionary item from parent API")
             else:
                 # Case 3: Target is a primitive value - wrap it in a dictionary with the path's last part as key
                 key_name = items_path.split('.')[-1] if items_path else "value"
                 items_to_process = [{key_name: target_data}]
-                logging.info(f"Processing primitive value '{target_data}' as dictionary with key '{key_name}'")
+                logger.info("Processing primitive value '%s' as dictionary with key '%s'", target_data, key_name)
+            
+            # One limiter per child config preserves its configured interval between calls
+            limiters = [_RateLimiter(child_config.get("interval", 1)) for child_config in child_api_configs]
             
-            # Process each item and call child APIs
+            # Resolve child API URLs for each item, then call them concurrently
+            resolved_configs = []
+            resolved_urls = []
+            resolved_limiters = []
             for item in items_to_process:
                 # For primitive values wrapped in dictionaries, log the item being processed
                 if not isinstance(item, dict):
-                    logging.warning(f"Item is not a dictionary: {item}. Creating a default key.")
+                    logger.warning("Item is not a dictionary: %s. Creating a default key.", item)
                     item = {"item": item}
                     
-                logging.debug(f"Processing item: {item}")
+                logger.debug("Processing item: %s", item)
                 
-                for child_config in child_api_configs:
-                    # Make a copy of the child config
-                    child_api = child_config.copy()
-                    
+                # Resolve URL placeholders from the item, falling back to the parent data
+                def replace_placeholder(match, item=item):
+                    key = match.group(1)
+                    if key in item:
+                        return str(item[key])
+                    if isinstance(parent_data, dict) and key in parent_data:
+                        return str(parent_data[key])
+                    return match.group(0)
+                
+                for child_config, limiter in zip(child_api_configs, limiters):
                     # Replace placeholders in URL with values from the item
-                    url = child_api.get("url", "")
-                    original_url = url
-                    
-                    # Handle dictionary items
-                    if isinstance(item, dict):
-                        for key, value in item.items():
-                            placeholder = f"{{{key}}}"
-                            if placeholder in url:
-                                url = url.replace(placeholder, str(value))
-                    
-                    # Check if all placeholders were replaced
-                    if '{' in url and '}' in url:
-                        logging.warning(f"Some placeholders not replaced in URL: {url}")
-                        
-                        # You could either skip this child API or try to find the values elsewhere
-                        # Option 1: Skip this child API for this item
-                        # continue
-                        
-                        # Option 2: Try to find values in the parent data as a fallback
-                        if isinstance(parent_data, dict):
-                            for key, value in parent_data.items():
-                                placeholder = f"{{{key}}}"
-                                if placeholder in url:
-                                    url = url.replace(placeholder, str(value))
+                    original_url = child_config.get("url", "")
+                    url = _PLACEHOLDER_RE.sub(replace_placeholder, original_url)
                     
                     # If we still have unresolved placeholders, log an error and skip
-                    if '{' in url and '}' in url:
-                        logging.error(f"Unresolved placeholders in URL: {url}. Skipping this child API call.")
+                    if _PLACEHOLDER_RE.search(url):
+                        logger.error("Unresolved placeholders in URL: %s. Skipping this child API call.", url)
                         continue
                     
-                    child_api["url"] = url
-                    logging.info(f"Calling child API: {url} (original: {original_url})")
-                    
-                    # Call the child API
-                    self.call_single_api(child_api)
-                    
-                    # Respect the interval between API calls
-                    interval = child_api.get("interval", 1)
-                    if interval > 0:
-                        time.sleep(interval)
+                    # Only the URL differs per item, so share the child config instead of copying it
+                    logger.info("Resolved child API: %s (original: %s)", url, original_url)
+                    resolved_configs.append(child_config)
+                    resolved_urls.append(url)
+                    resolved_limiters.append(limiter)
+            
+            with ThreadPoolExecutor(max_workers=NESTED_MAX_WORKERS) as executor:
+                list(executor.map(self._call_child_api, resolved_configs, resolved_urls, resolved_limiters))
                         
         except Exception as e:
-            logging.error(f"Error processing nested APIs: {str(e)}")
+            logger.error("Error processing nested APIs: %s", e)
             import traceback
-            logging.error(traceback.format_exc())
+            logger.error(traceback.format_exc())
+    
+    def _call_child_api(self, child_config, url, limiter):
+        """Call a resolved child API once its rate limiter allows it."""
+        limiter.wait()
+        logger.info("Calling child API: %s", url)
+        return self._call_api(child_config, url_override=url)
@@ -0,0 +1,50 @@
+import json
+
+try:
+    import orjson
+    
+    def json_loads(data):
+        """
+        Parse JSON text or bytes.
+        
+        orjson rejects NaN/Infinity, which json.loads (like response.json()) accepts,
+        so those bodies are parsed again with the standard library. Integers wider
+        than 64 bits are decoded as floats by orjson and lose precision.
+        
+        Args:
+            data: JSON document as str or bytes
+        
+        Returns:
+            Any: Parsed JSON data
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+    
+    def json_dumps_str(data) -> str:
+        """Serialize data to compact JSON text."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def json_dumps_bytes(data) -> bytes:
+        """Serialize data to compact UTF-8 JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    
+    def json_dumps_indented(data) -> str:
+        """Serialize data to JSON text indented by two spaces."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    # orjson is optional; fall back to the standard library
+    json_loads = json.loads
+    
+    # One shared encoder instead of json.dumps building a new one per call;
+    # ensure_ascii=False also skips the slower \uXXXX escaping path
+    json_dumps_str = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+    
+    def json_dumps_bytes(data) -> bytes:
+        """Serialize data to compact UTF-8 JSON bytes."""
+        return json_dumps_str(data).encode()
+    
+    def json_dumps_indented(data) -> str:
+        """Serialize data to JSON text indented by two spaces."""
+        return json.dumps(data, indent=2)
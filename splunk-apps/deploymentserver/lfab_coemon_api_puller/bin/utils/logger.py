@@ -1,6 +1,25 @@
 import logging
 import os
-from datetime import datetime
+import time
+
+# Formatted timestamp, cached per wall-clock second
+_ts_cache = (0, '')
+
+def fast_timestamp():
+    """
+    Get the current local time formatted as YYYYmmdd_HHMMSS.
+    
+    The string is only re-formatted when the wall-clock second changes, which
+    keeps it cheap to call for every saved response.
+    
+    Returns:
+        str: Formatted timestamp
+    """
+    global _ts_cache
+    now_s = int(time.time())
+    if now_s != _ts_cache[0]:
+        _ts_cache = (now_s, time.strftime("%Y%m%d_%H%M%S", time.localtime(now_s)))
+    return _ts_cache[1]
 
 def setup_logger(log_dir=None):
     """
@@ -19,7 +38,7 @@ def setup_logger(log_dir=None):
     os.makedirs(log_dir, exist_ok=True)
     
     # Create a timestamp for the log filename
-    timestamp = datetime.now().strftime("%Y%m%d")
+    timestamp = fast_timestamp()[:8]
     log_file = os.path.join(log_dir, f"api_poller_{timestamp}.log")
     
     # Set up logging format and handlers
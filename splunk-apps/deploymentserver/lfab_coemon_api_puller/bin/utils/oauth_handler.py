@@ -1,7 +1,18 @@
 import requests
 import time
 import logging
-from datetime import datetime, timedelta
+import threading
+import os
+import json
+import hashlib
+import tempfile
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Cached tokens are only reused if they stay valid for at least this many seconds
+TOKEN_CACHE_MARGIN = 300
 
 class OAuthHandler:
     def __init__(self, client_id, client_secret, token_url, verify, scope=None):
@@ -21,25 +32,123 @@ class OAuthHandler:
         self.verify = verify
         self.scope = scope
         self.token = None
-        self.token_expiry = None
+        self._expiry_monotonic = 0.0  # time.monotonic() deadline for the current token
         self.token_type = "bearer"  # Default token type
         
+        # Tokens are refreshed in the background by a timer; the lock serializes refreshes
+        self._lock = threading.Lock()
+        self._refresh_timer = None
+        
+        # Keep-alive session so token refreshes reuse the TLS connection
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['POST']),
+                raise_on_status=False
+            )
+        ))
+        
+        # Reuse a still-valid token persisted by a previous run so restarts don't force a refresh
+        self._cache_file = os.path.join(
+            tempfile.gettempdir(),
+            f"oauth_{hashlib.sha256((str(client_id) + str(token_url)).encode()).hexdigest()[:16]}.json"
+        )
+        self._load_cached_token()
+        
     def get_token(self):
         """
         Get a valid OAuth token, refreshing if necessary.
         
+        Tokens are normally refreshed ahead of expiry by a background timer, so
+        this only requests a token inline on first use or if a refresh failed.
+        
         Returns:
             str: The valid access token
         """
-        current_time = datetime.now()
-        
-        # If we don't have a token or it's expired or about to expire in the next 4 hours
-        if (self.token is None or 
-            self.token_expiry is None or 
-            current_time + timedelta(hours=4) >= self.token_expiry):
+        token = self.token
+        if token is None or time.monotonic() >= self._expiry_monotonic:
+            with self._lock:
+                if self.token is None or time.monotonic() >= self._expiry_monotonic:
+                    self._request_new_token()
+                token = self.token
+            
+        return token
+    
+    def _refresh_token(self):
+        """Refresh the token from the background timer."""
+        with self._lock:
             self._request_new_token()
+    
+    def _schedule_refresh(self, expires_in):
+        """
+        Schedule a background refresh ahead of token expiry.
+        
+        The lead time is five minutes, or a tenth of the lifetime for
+        short-lived tokens, so the refresh never fires immediately.
+        
+        Args:
+            expires_in: Token lifetime in seconds
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        delay = expires_in - min(TOKEN_CACHE_MARGIN, expires_in * 0.1)
+        self._refresh_timer = threading.Timer(max(delay, 1), self._refresh_token)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _load_cached_token(self):
+        """Populate the token from the on-disk cache if it is still valid."""
+        try:
+            with open(self._cache_file, 'r') as f:
+                # Ignore cache files that another user could have planted
+                if hasattr(os, 'getuid') and os.fstat(f.fileno()).st_uid != os.getuid():
+                    return
+                cached = json.load(f)
             
-        return self.token
+            remaining = cached['expiry'] - time.time()
+            if remaining > TOKEN_CACHE_MARGIN:
+                self.token = cached['token']
+                self.token_type = cached.get('token_type', 'bearer')
+                self._expiry_monotonic = time.monotonic() + remaining
+                self._schedule_refresh(remaining)
+                logger.info("Loaded cached OAuth token, expires in %d seconds", remaining)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Ignoring unreadable OAuth token cache %s: %s", self._cache_file, e)
+    
+    def _save_cached_token(self, expires_in):
+        """
+        Persist the current token so later runs can reuse it.
+        
+        Args:
+            expires_in: Token lifetime in seconds
+        """
+        tmp_file = None
+        try:
+            # mkstemp creates a fresh 0600 file with O_EXCL, so a planted symlink can't redirect the write
+            fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(self._cache_file), prefix='oauth_', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    'token': self.token,
+                    'expiry': time.time() + expires_in,
+                    'token_type': self.token_type
+                }, f)
+            os.replace(tmp_file, self._cache_file)
+            tmp_file = None
+        except OSError as e:
+            logger.warning("Failed to write OAuth token cache %s: %s", self._cache_file, e)
+        finally:
+            if tmp_file is not None:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
     
     def _request_new_token(self):
         """Request a new token from the OAuth server."""
@@ -53,32 +162,41 @@ class OAuthHandler:
             #if self.scope:
             #    data['scope'] = self.scope
                 
-            logging.info(f"Requesting new OAuth token from {self.token_url}")
-            response = requests.post(
+            logger.info("Requesting new OAuth token from %s", self.token_url)
+            response = self._session.post(
                 self.token_url,
                 data=data,
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                verify=self.verify
+                verify=self.verify,
+                timeout=(3.05, 10)
             )
             
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = json.loads(response.content)
                 self.token = token_data.get('access_token')
                 
                 # Calculate token expiry time
                 expires_in = token_data.get('expires_in', 3600)  # Default to 1 hour
-                self.token_expiry = datetime.now() + timedelta(seconds=expires_in)
+                self._expiry_monotonic = time.monotonic() + expires_in
                 
                 # Get token type if available
                 self.token_type = token_data.get('token_type', 'bearer').lower()
                 
-                logging.info(f"OAuth token obtained successfully, expires in {expires_in} seconds")
+                logger.info("OAuth token obtained successfully, expires in %s seconds", expires_in)
+                self._schedule_refresh(expires_in)
+                self._save_cached_token(expires_in)
             else:
-                logging.error(f"Failed to get OAuth token. Status: {response.status_code}, Response: {response.text}")
+                logger.error("Failed to get OAuth token. Status: %s, Response: %s", response.status_code, response.text)
                 self.token = None
-                self.token_expiry = None
+                self._expiry_monotonic = 0.0
                 
         except Exception as e:
-            logging.error(f"Error getting OAuth token: {str(e)}")
+            logger.error("Error getting OAuth token: %s", e)
             self.token = None
-            self.token_expiry = None
+            self._expiry_monotonic = 0.0
+    
+    def close(self):
+        """Cancel any pending refresh and close the underlying HTTP session."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self._session.close()
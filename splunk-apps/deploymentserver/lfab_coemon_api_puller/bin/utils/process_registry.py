@@ -5,6 +5,8 @@ import importlib.util
 import inspect
 from typing import Dict, Callable, Any, List, Optional, Union
 
+logger = logging.getLogger(__name__)
+
 class ProcessorRegistry:
     """
     Registry for API processors that handle data before and after API calls.
@@ -14,6 +16,8 @@ class ProcessorRegistry:
         self.preprocessors = {}
         self.postprocessors = {}
         self.output_processors = {}
+        # Loaded processor modules keyed by file path, with the mtime they were loaded at
+        self._module_cache: Dict[str, tuple] = {}
     
     def register_preprocessor(self, name: str, processor_func: Callable) -> None:
         """
@@ -24,10 +28,10 @@ class ProcessorRegistry:
             processor_func: Preprocessor function
         """
         if name in self.preprocessors:
-            logging.warning(f"Overriding existing preprocessor: {name}")
+            logger.warning("Overriding existing preprocessor: %s", name)
         
         self.preprocessors[name] = processor_func
-        logging.info(f"Registered preprocessor: {name}")
+        logger.info("Registered preprocessor: %s", name)
     
     def register_postprocessor(self, name: str, processor_func: Callable) -> None:
         """
@@ -38,10 +42,10 @@ class ProcessorRegistry:
             processor_func: Postprocessor function
         """
         if name in self.postprocessors:
-            logging.warning(f"Overriding existing postprocessor: {name}")
+            logger.warning("Overriding existing postprocessor: %s", name)
         
         self.postprocessors[name] = processor_func
-        logging.info(f"Registered postprocessor: {name}")
+        logger.info("Registered postprocessor: %s", name)
     
     def register_output_processor(self, name: str, processor_func: Callable) -> None:
         """
@@ -52,10 +56,81 @@ class ProcessorRegistry:
             processor_func: Output processor function
         """
         if name in self.output_processors:
-            logging.warning(f"Overriding existing output processor: {name}")
+            logger.warning("Overriding existing output processor: %s", name)
         
         self.output_processors[name] = processor_func
-        logging.info(f"Registered output processor: {name}")
+        logger.info("Registered output processor: %s", name)
+    
+    def register_bulk(self, preprocessors: Optional[Dict[str, Callable]] = None,
+                      postprocessors: Optional[Dict[str, Callable]] = None,
+                      output_processors: Optional[Dict[str, Callable]] = None) -> None:
+        """
+        Register several processors at once.
+        
+        Args:
+            preprocessors: Preprocessor functions keyed by name
+            postprocessors: Postprocessor functions keyed by name
+            output_processors: Output processor functions keyed by name
+        """
+        for kind, registered, new in (
+            ("preprocessor", self.preprocessors, preprocessors),
+            ("postprocessor", self.postprocessors, postprocessors),
+            ("output processor", self.output_processors, output_processors),
+        ):
+            if not new:
+                continue
+            
+            for name in new:
+                if name in registered:
+                    logger.warning("Overriding existing %s: %s", kind, name)
+            
+            registered.update(new)
+            logger.info("Registered %ss: %s", kind, ", ".join(new))
+    
+    def get_preprocessor(self, name: str) -> Optional[Callable]:
+        """
+        Look up a preprocessor function by name.
+        
+        Args:
+            name: Name of the preprocessor
+            
+        Returns:
+            Optional[Callable]: Preprocessor function, or None if not registered
+        """
+        processor_func = self.preprocessors.get(name)
+        if processor_func is None:
+            logger.error("Preprocessor not found: %s", name)
+        return processor_func
+    
+    def get_postprocessor(self, name: str) -> Optional[Callable]:
+        """
+        Look up a postprocessor function by name.
+        
+        Args:
+            name: Name of the postprocessor
+            
+        Returns:
+            Optional[Callable]: Postprocessor function, or None if not registered
+        """
+        processor_func = self.postprocessors.get(name)
+        if processor_func is None:
+            logger.error("Postprocessor not found: %s", name)
+        return processor_func
+    
+    def get_output_processor(self, name: str) -> Optional[Callable]:
+        """
+        Look up an output processor function by name.
+        
+        Args:
+            name: Name of the output processor
+            
+        Returns:
+            Optional[Callable]: Output processor function, or None if not registered
+        """
+        processor_func = self.output_processors.get(name)
+        if processor_func is None:
+            logger.error("Output processor not found: %s", name)
+        return processor_func
     
     def load_processors_from_directory(self, directory: str) -> None:
         """
@@ -65,7 +140,7 @@ class ProcessorRegistry:
             directory: Path to directory containing processor modules
         """
         if not os.path.isdir(directory):
-            logging.error(f"Processor directory not found: {directory}")
+            logger.error("Processor directory not found: %s", directory)
             return
         
         # Add the directory to Python path if not already there
@@ -73,9 +148,11 @@ class ProcessorRegistry:
             sys.path.append(directory)
         
         # Load each Python file in the directory
-        for filename in os.listdir(directory):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                self._load_processor_module(os.path.join(directory, filename))
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                filename = entry.name
+                if filename.endswith('.py') and not filename.startswith('__') and entry.is_file():
+                    self._load_processor_module(entry.path)
     
     def _load_processor_module(self, file_path: str) -> None:
         """
@@ -87,25 +164,31 @@ class ProcessorRegistry:
         try:
             module_name = os.path.splitext(os.path.basename(file_path))[0]
             
+            # Skip modules that were already loaded and haven't changed since
+            mtime = os.stat(file_path).st_mtime
+            if self._module_cache.get(file_path, (None,))[0] == mtime:
+                return
+            
             # Load the module
             spec = importlib.util.spec_from_file_location(module_name, file_path)
             if spec is None or spec.loader is None:
-                logging.error(f"Failed to load processor module spec: {file_path}")
+                logger.error("Failed to load processor module spec: %s", file_path)
                 return
                 
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
+            self._module_cache[file_path] = (mtime, module)
             
             # Check if the module has a register_processors function
             if hasattr(module, 'register_processors'):
                 module.register_processors(self)
-                logging.info(f"Registered processors from module: {module_name}")
+                logger.info("Registered processors from module: %s", module_name)
             else:
                 # Auto-discover processor functions
                 self._auto_discover_processors(module)
                 
         except Exception as e:
-            logging.error(f"Error loading processor module {file_path}: {str(e)}")
+            logger.error("Error loading processor module %s: %s", file_path, e)
     
     def _auto_discover_processors(self, module) -> None:
         """
@@ -117,23 +200,29 @@ class ProcessorRegistry:
         module_name = module.__name__
         functions_count = 0
         
-        for name, obj in inspect.getmembers(module, inspect.isfunction):
+        # Map each naming-convention prefix to its registration method
+        prefixes = {
+            'preprocess_': self.register_preprocessor,
+            'postprocess_': self.register_postprocessor,
+            'output_': self.register_output_processor,
+        }
+        
+        # Walk the module namespace directly; inspect.getmembers would getattr
+        # and sort every attribute just to keep the functions
+        for name, obj in vars(module).items():
+            if not inspect.isfunction(obj):
+                continue
+            
             # Check for processor function naming conventions
-            if name.startswith('preprocess_'):
-                processor_name = name[len('preprocess_'):]
-                self.register_preprocessor(processor_name, obj)
-                functions_count += 1
-            elif name.startswith('postprocess_'):
-                processor_name = name[len('postprocess_'):]
-                self.register_postprocessor(processor_name, obj)
-                functions_count += 1
-            elif name.startswith('output_'):
-                processor_name = name[len('output_'):]
-                self.register_output_processor(processor_name, obj)
-                functions_count += 1
+            for prefix, register in prefixes.items():
+                processor_name = name.removeprefix(prefix)
+                if processor_name != name:
+                    register(processor_name, obj)
+                    functions_count += 1
+                    break
         
         if functions_count > 0:
-            logging.info(f"Auto-discovered {functions_count} processors from module: {module_name}")
+            logger.info("Auto-discovered %s processors from module: %s", functions_count, module_name)
     
     def run_preprocessor(self, name: str, api_config: Dict, **kwargs) -> Dict:
         """
@@ -147,15 +236,16 @@ class ProcessorRegistry:
         Returns:
             Dict: Modified API configuration
         """
-        if name not in self.preprocessors:
-            logging.error(f"Preprocessor not found: {name}")
+        processor_func = self.preprocessors.get(name)
+        if processor_func is None:
+            logger.error("Preprocessor not found: %s", name)
             return api_config
         
         try:
-            result = self.preprocessors[name](api_config, **kwargs)
+            result = processor_func(api_config, **kwargs)
             return result if result is not None else api_config
         except Exception as e:
-            logging.error(f"Error running preprocessor {name}: {str(e)}")
+            logger.error("Error running preprocessor %s: %s", name, e)
             return api_config
     
     def run_postprocessor(self, name: str, response, **kwargs) -> Any:
@@ -170,15 +260,16 @@ class ProcessorRegistry:
         Returns:
             Any: Processed response
         """
-        if name not in self.postprocessors:
-            logging.error(f"Postprocessor not found: {name}")
+        processor_func = self.postprocessors.get(name)
+        if processor_func is None:
+            logger.error("Postprocessor not found: %s", name)
             return response
         
         try:
-            result = self.postprocessors[name](response, **kwargs)
+            result = processor_func(response, **kwargs)
             return result if result is not None else response
         except Exception as e:
-            logging.error(f"Error running postprocessor {name}: {str(e)}")
+            logger.error("Error running postprocessor %s: %s", name, e)
             return response
     
     def run_output_processor(self, name: str, data, endpoint: str, **kwargs) -> bool:
@@ -194,14 +285,15 @@ class ProcessorRegistry:
         Returns:
             bool: Success flag
         """
-        if name not in self.output_processors:
-            logging.error(f"Output processor not found: {name}")
+        processor_func = self.output_processors.get(name)
+        if processor_func is None:
+            logger.error("Output processor not found: %s", name)
             return False
         
         try:
-            return self.output_processors[name](data, endpoint, **kwargs)
+            return processor_func(data, endpoint, **kwargs)
         except Exception as e:
-            logging.error(f"Error running output processor {name}: {str(e)}")
+            logger.error("Error running output processor %s: %s", name, e)
             return False
 
 
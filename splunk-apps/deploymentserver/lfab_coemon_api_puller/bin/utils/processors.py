@@ -6,13 +6,372 @@ This module provides three types of processors:
 2. Postprocessors: Transform API responses after they're received
 3. Output processors: Control how processed data is saved or output
 """
-import json
 import logging
 import os
 import csv
+import functools
+import itertools
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union
 
+from utils.json_utils import json_dumps_bytes, json_dumps_str, json_loads
+from utils.logger import fast_timestamp
+
+try:
+    # python-isal compresses several times faster than the stdlib gzip module
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+logger = logging.getLogger(__name__)
+
+# Default output directory for file output processors
+_DEFAULT_LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
+
+# Output directories already created by this process
+_created_dirs = set()
+
+# Characters replaced when deriving output filenames from endpoint URLs
+_ENDPOINT_TRANS = str.maketrans({'?': '_', '&': '_'})
+
+# Bytes of serialized JSONL lines to accumulate before each file write
+JSONL_WRITE_BUFFER_SIZE = 1 << 20
+
+# Maximum buffers per os.writev call (the platform's IOV_MAX, usually 1024)
+try:
+    JSONL_IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    JSONL_IOV_MAX = 1024
+
+# Number of HEC batches posted concurrently; kept below the session's pool size
+# so no batch waits for a free connection
+HEC_MAX_WORKERS = 8
+
+# HEC bodies at least this large are gzip-compressed before sending
+HEC_GZIP_MIN_BYTES = 1024
+
+# Maximum number of bytes of an HEC error response body to log
+HEC_ERROR_TEXT_LIMIT = 512
+
+# Shared HEC session so repeated sends reuse keep-alive connections. requests is
+# only imported when the session is first created, so importing this module for
+# its other processors doesn't pull it in.
+_HEC_SESSION = None
+_hec_session_lock = threading.Lock()
+
+# Optional httpx HTTP/2 clients keyed by SSL verification setting, used when an
+# HEC output sets http2; None marks httpx (or its h2 extra) as unavailable
+_HEC_HTTP2_CLIENTS = {}
+
+# Request headers per HEC token, so they aren't rebuilt on every send
+_HEC_HEADERS = {}
+
+# Shared pool for concurrent HEC batch POSTs; threads are started on first use
+_HEC_POOL = ThreadPoolExecutor(max_workers=HEC_MAX_WORKERS, thread_name_prefix='hec')
+
+def _get_hec_session():
+    """
+    Get the shared Splunk HEC session, creating it on first use.
+    
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTPS adapter
+    """
+    global _HEC_SESSION
+    if _HEC_SESSION is None:
+        with _hec_session_lock:
+            if _HEC_SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=32,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.2,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=frozenset(['POST']),
+                        raise_on_status=False
+                    )
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _HEC_SESSION = session
+    return _HEC_SESSION
+
+def _get_hec_http2_client(verify):
+    """
+    Get a shared HTTP/2 httpx client for Splunk HEC, creating it on first use.
+    
+    HTTP/2 multiplexes concurrent batches over a single connection. httpx and
+    its h2 extra are optional; without them this returns None and callers fall
+    back to the requests session.
+    
+    Args:
+        verify: SSL verification flag
+        
+    Returns:
+        Optional[httpx.Client]: HTTP/2 client, or None if httpx is unavailable
+    """
+    if verify in _HEC_HTTP2_CLIENTS:
+        return _HEC_HTTP2_CLIENTS[verify]
+    
+    with _hec_session_lock:
+        if verify not in _HEC_HTTP2_CLIENTS:
+            try:
+                import httpx
+                
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    verify=verify,
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+                    retries=3
+                )
+                client = httpx.Client(transport=transport, timeout=httpx.Timeout(30.0, connect=3.05))
+            except ImportError:
+                logger.warning("httpx with HTTP/2 support is not installed, sending to Splunk HEC over HTTP/1.1")
+                client = None
+            _HEC_HTTP2_CLIENTS[verify] = client
+    return _HEC_HTTP2_CLIENTS[verify]
+
+def _post_hec_batch(hec_url: str, body: bytes, headers: Dict, verify, compress: bool = True,
+                    http2: bool = False) -> bool:
+    """
+    Send one batch of events to Splunk HEC.
+    
+    Args:
+        hec_url: Splunk HEC URL
+        body: Concatenated JSON events
+        headers: Request headers
+        verify: SSL verification flag
+        compress: Whether to gzip bodies of at least HEC_GZIP_MIN_BYTES
+        http2: Whether to send over the shared httpx HTTP/2 client when available
+        
+    Returns:
+        bool: Success flag
+    """
+    try:
+        # Event JSON compresses well; the fastest level keeps the CPU cost low
+        if compress and len(body) >= HEC_GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**headers, "Content-Encoding": "gzip"}
+        
+        client = _get_hec_http2_client(verify) if http2 else None
+        if client is not None:
+            with client.stream("POST", hec_url, content=body, headers=headers) as response:
+                if response.status_code not in (200, 201):
+                    error_text = next(response.iter_bytes(HEC_ERROR_TEXT_LIMIT), b"")[:HEC_ERROR_TEXT_LIMIT]
+                    logger.error("Error sending to Splunk HEC: %s - %s", response.status_code,
+                                 error_text.decode('utf-8', 'replace'))
+                    return False
+                response.read()
+            return True
+        
+        # Stream the response so an error body is never read in full
+        response = _get_hec_session().post(
+            hec_url,
+            data=body,
+            headers=headers,
+            verify=verify,
+            timeout=(3.05, 30),
+            stream=True
+        )
+        
+        with response:
+            if response.status_code not in (200, 201):
+                error_text = next(response.iter_content(HEC_ERROR_TEXT_LIMIT), b"").decode('utf-8', 'replace')
+                logger.error("Error sending to Splunk HEC: %s - %s", response.status_code, error_text)
+                return False
+            
+            # Read the short success body so the connection goes back to the pool
+            response.content
+        return True
+        
+    except Exception as e:
+        logger.error("Error sending to Splunk HEC: %s", e)
+        return False
+
+def _ensure_directory(directory: str) -> None:
+    """
+    Create an output directory once per process.
+    
+    Args:
+        directory: Directory path
+    """
+    if directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+def _writev_all(fd: int, buffers: List[bytes]) -> None:
+    """
+    Write a list of buffers to a file descriptor with os.writev, finishing any
+    short write with plain os.write calls.
+    
+    Args:
+        fd: Open file descriptor
+        buffers: Byte strings to write in order
+    """
+    written = os.writev(fd, buffers)
+    total = sum(map(len, buffers))
+    if written < total:
+        remaining = memoryview(b"".join(buffers))[written:]
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+
+def _write_jsonl_lines(file_path: str, lines) -> None:
+    """
+    Write encoded lines to a file, one per line, replacing any existing file.
+    
+    Uses vectored os.writev calls where available so lines are handed to the
+    kernel without being copied into an intermediate buffer, and otherwise
+    accumulates them into large buffered writes.
+    
+    Args:
+        file_path: Output file path
+        lines: Iterable of encoded lines without trailing newlines
+    """
+    if hasattr(os, 'writev'):
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            iov = []
+            iov_bytes = 0
+            for line in lines:
+                iov.append(line)
+                iov.append(b'\n')
+                iov_bytes += len(line) + 1
+                if len(iov) >= JSONL_IOV_MAX or iov_bytes >= JSONL_WRITE_BUFFER_SIZE:
+                    _writev_all(fd, iov)
+                    iov.clear()
+                    iov_bytes = 0
+            if iov:
+                _writev_all(fd, iov)
+        finally:
+            os.close(fd)
+        return
+    
+    # No writev (e.g. Windows): accumulate lines so large outputs take few write calls
+    with open(file_path, 'wb', buffering=JSONL_WRITE_BUFFER_SIZE) as f:
+        buf = bytearray()
+        for line in lines:
+            buf += line
+            buf += b'\n'
+            if len(buf) >= JSONL_WRITE_BUFFER_SIZE:
+                f.write(buf)
+                buf.clear()
+        if buf:
+            f.write(buf)
+
+def _get_json(response):
+    """
+    Parse a response body as JSON, caching the result on the response object.
+    
+    Args:
+        response: API response object
+        
+    Returns:
+        Any: Parsed JSON data
+    """
+    data = getattr(response, '_parsed_json', None)
+    if data is None:
+        data = json_loads(response.content)
+        response._parsed_json = data
+    return data
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple:
+    """
+    Split a dot-notation path into its parts. Cached because the same
+    configured paths are split on every response.
+    
+    Args:
+        path: Dot-notation path (e.g., "data.items")
+        
+    Returns:
+        tuple: Path parts
+    """
+    return tuple(path.split('.'))
+
+# Sentinel returned by _compile_path accessors when the path can't be followed
+_MISSING = object()
+
+@functools.lru_cache(maxsize=128)
+def _compile_path(parts: tuple):
+    """
+    Build an accessor for postprocess_extract_nested. List indices are parsed
+    once here, and the accessor is cached per path so repeated calls with the
+    same path only walk the data.
+    
+    Args:
+        parts: Path parts (keys or numeric list indices)
+        
+    Returns:
+        Callable: Function taking the data and returning (value, bad_index);
+            value is _MISSING if the path can't be followed, with bad_index set
+            when a list index was out of range
+    """
+    steps = tuple((key, int(key) if isinstance(key, str) and key.isdigit() else None) for key in parts)
+    
+    def accessor(data):
+        value = data
+        for key, index in steps:
+            if isinstance(value, dict) and key in value:
+                value = value[key]
+            elif index is not None and isinstance(value, list):
+                if index >= len(value):
+                    return _MISSING, index
+                value = value[index]
+            else:
+                return _MISSING, None
+        return value, None
+    
+    return accessor
+
+# {name} placeholders substituted by preprocess_template_url
+_TEMPLATE_RE = re.compile(r'\{([^{}]+)\}')
+
+# Time range placeholders substituted by preprocess_update_time_range
+_TR_RE = re.compile(r'\{(start_time|end_time)\}')
+
+# Patterns for camelCase/PascalCase to snake_case conversion in transform_keys
+_SNAKE_RE1 = re.compile(r'(.)([A-Z][a-z]+)')
+_SNAKE_RE2 = re.compile(r'([a-z0-9])([A-Z])')
+
+@functools.lru_cache(maxsize=4096)
+def _transform_key_cached(key: str, case: Optional[str], replacements_items: tuple) -> str:
+    """
+    Transform a single key for postprocess_transform_keys.
+    
+    Args:
+        key: Original key
+        case: Transform case ('lower', 'upper', 'snake', or None)
+        replacements_items: (old, new) key replacement pairs
+        
+    Returns:
+        str: Transformed key
+    """
+    # First apply any direct replacements
+    for old_key, new_key in replacements_items:
+        if key == old_key:
+            key = new_key
+            break
+    
+    # Then apply case transformation
+    if case == 'lower':
+        return key.lower()
+    elif case == 'upper':
+        return key.upper()
+    elif case == 'snake':
+        # Convert camelCase or PascalCase to snake_case
+        return _SNAKE_RE2.sub(r'\1_\2', _SNAKE_RE1.sub(r'\1_\2', key)).lower()
+    else:
+        return key
+
 # =====================
 # PREPROCESSORS
 # =====================
@@ -29,11 +388,6 @@ def preprocess_update_time_range(api_config: Dict, **kwargs) -> Dict:
         Dict: Updated API configuration
     """
     try:
-        # Make a copy of the API config to avoid modifying the original
-        updated_config = api_config.copy()
-        if 'body' not in updated_config:
-            updated_config['body'] = {}
-        
         # Calculate time range
         time_range_hours = kwargs.get('time_range_hours', 24)
         end_time = datetime.now()
@@ -43,22 +397,27 @@ def preprocess_update_time_range(api_config: Dict, **kwargs) -> Dict:
         start_time_str = start_time.isoformat()
         end_time_str = end_time.isoformat()
         
-        # Update request body with time range
-        body = updated_config['body']
+        # Substitute both placeholders in a single pass over each string
+        repl = {'start_time': start_time_str, 'end_time': end_time_str}
+        replace_times = lambda m: repl[m.group(1)]
+        
+        # Build a new body so the original config's body is never mutated
+        body = api_config.get('body', {})
         if isinstance(body, dict):
             # Replace placeholders in any string value
-            for key, value in body.items():
-                if isinstance(value, str):
-                    body[key] = value.replace('{start_time}', start_time_str).replace('{end_time}', end_time_str)
+            body = {
+                key: _TR_RE.sub(replace_times, value) if isinstance(value, str) else value
+                for key, value in body.items()
+            }
         elif isinstance(body, str):
             # Replace placeholders in the entire body string
-            updated_config['body'] = body.replace('{start_time}', start_time_str).replace('{end_time}', end_time_str)
+            body = _TR_RE.sub(replace_times, body)
         
-        logging.info(f"Updated time range: {start_time_str} to {end_time_str}")
-        return updated_config
+        logger.info("Updated time range: %s to %s", start_time_str, end_time_str)
+        return {**api_config, 'body': body}
         
     except Exception as e:
-        logging.error(f"Error updating time range: {str(e)}")
+        logger.error("Error updating time range: %s", e)
         return api_config
 
 def preprocess_add_headers(api_config: Dict, **kwargs) -> Dict:
@@ -73,20 +432,14 @@ def preprocess_add_headers(api_config: Dict, **kwargs) -> Dict:
         Dict: Updated API configuration
     """
     try:
-        # Make a copy of the API config to avoid modifying the original
-        updated_config = api_config.copy()
-        if 'headers' not in updated_config:
-            updated_config['headers'] = {}
-        
-        # Add custom headers
+        # Add custom headers, building new dicts so the original config is never mutated
         headers = kwargs.get('headers', {})
-        updated_config['headers'].update(headers)
         
-        logging.info(f"Added custom headers: {list(headers.keys())}")
-        return updated_config
+        logger.info("Added custom headers: %s", list(headers))
+        return {**api_config, 'headers': {**api_config.get('headers', {}), **headers}}
         
     except Exception as e:
-        logging.error(f"Error adding headers: {str(e)}")
+        logger.error("Error adding headers: %s", e)
         return api_config
 
 def preprocess_template_url(api_config: Dict, **kwargs) -> Dict:
@@ -101,26 +454,25 @@ def preprocess_template_url(api_config: Dict, **kwargs) -> Dict:
         Dict: Updated API configuration
     """
     try:
-        # Make a copy of the API config to avoid modifying the original
-        updated_config = api_config.copy()
-        if 'url' not in updated_config:
-            return updated_config
+        if 'url' not in api_config:
+            return api_config
         
         # Replace variables in URL
         variables = kwargs.get('variables', {})
-        url = updated_config['url']
+        url = api_config['url']
+        
+        # Single pass; unknown placeholders and other brace text are left intact
+        def replace_variable(match):
+            name = match.group(1)
+            return str(variables[name]) if name in variables else match.group(0)
         
-        for var_name, var_value in variables.items():
-            placeholder = '{' + var_name + '}'
-            if placeholder in url:
-                url = url.replace(placeholder, str(var_value))
+        url = _TEMPLATE_RE.sub(replace_variable, url)
         
-        updated_config['url'] = url
-        logging.info(f"URL after template substitution: {url}")
-        return updated_config
+        logger.info("URL after template substitution: %s", url)
+        return {**api_config, 'url': url}
         
     except Exception as e:
-        logging.error(f"Error applying URL template: {str(e)}")
+        logger.error("Error applying URL template: %s", e)
         return api_config
 
 def preprocess_pagination_params(api_config: Dict, **kwargs) -> Dict:
@@ -138,26 +490,19 @@ def preprocess_pagination_params(api_config: Dict, **kwargs) -> Dict:
         Dict: Updated API configuration
     """
     try:
-        # Make a copy of the API config to avoid modifying the original
-        updated_config = api_config.copy()
-        if 'params' not in updated_config:
-            updated_config['params'] = {}
-        
         # Get pagination parameters
         page_param = kwargs.get('page_param', 'page')
         size_param = kwargs.get('size_param', 'size')
         page = kwargs.get('page', 1)
         size = kwargs.get('size', 100)
         
-        # Add pagination parameters
-        updated_config['params'][page_param] = page
-        updated_config['params'][size_param] = size
+        logger.info("Added pagination parameters: %s=%s, %s=%s", page_param, page, size_param, size)
         
-        logging.info(f"Added pagination parameters: {page_param}={page}, {size_param}={size}")
-        return updated_config
+        # Add pagination parameters, building new dicts so the original config is never mutated
+        return {**api_config, 'params': {**api_config.get('params', {}), page_param: page, size_param: size}}
         
     except Exception as e:
-        logging.error(f"Error adding pagination parameters: {str(e)}")
+        logger.error("Error adding pagination parameters: %s", e)
         return api_config
 
 # =====================
@@ -177,35 +522,38 @@ def postprocess_filter_response(response, **kwargs) -> Dict:
     """
     try:
         # Parse the JSON response
-        data = response.json()
+        data = _get_json(response)
         
         # Get the list of fields to keep
         fields = kwargs.get('fields', [])
         if not fields:
-            logging.warning("No fields specified for filter_response processor")
+            logger.warning("No fields specified for filter_response processor")
             return data
         
+        # Hash lookups instead of scanning the fields list for every key
+        fields_set = frozenset(fields)
+        
         # Filter the response
         if isinstance(data, dict):
-            filtered_data = {k: v for k, v in data.items() if k in fields}
-            logging.info(f"Filtered response to {len(filtered_data)} fields")
+            filtered_data = {k: v for k, v in data.items() if k in fields_set}
+            logger.info("Filtered response to %s fields", len(filtered_data))
             return filtered_data
         elif isinstance(data, list):
             filtered_data = []
             for item in data:
                 if isinstance(item, dict):
-                    filtered_item = {k: v for k, v in item.items() if k in fields}
+                    filtered_item = {k: v for k, v in item.items() if k in fields_set}
                     filtered_data.append(filtered_item)
                 else:
                     filtered_data.append(item)
-            logging.info(f"Filtered {len(data)} list items")
+            logger.info("Filtered %s list items", len(data))
             return filtered_data
         else:
-            logging.warning("Response data is not a dict or list, cannot filter")
+            logger.warning("Response data is not a dict or list, cannot filter")
             return data
         
     except Exception as e:
-        logging.error(f"Error filtering response: {str(e)}")
+        logger.error("Error filtering response: %s", e)
         return None
 
 def postprocess_flatten_json(response, **kwargs) -> Dict:
@@ -221,7 +569,7 @@ def postprocess_flatten_json(response, **kwargs) -> Dict:
     """
     try:
         # Parse the JSON response
-        data = response.json()
+        data = _get_json(response)
         
         # Add optional metadata if requested
         if kwargs.get("add_metadata", False):
@@ -233,13 +581,13 @@ def postprocess_flatten_json(response, **kwargs) -> Dict:
                 }
         
         # Convert back to JSON string without pretty-printing (no indent)
-        flat_json = json.dumps(data, separators=(',', ':'))
+        flat_json = json_dumps_str(data)
         
         # Special handling to indicate this is a string output
         return {"__flatten_json_output": flat_json}
         
     except Exception as e:
-        logging.error(f"Error flattening JSON response: {str(e)}")
+        logger.error("Error flattening JSON response: %s", e)
         return None
 
 def postprocess_split_json_array(response, **kwargs) -> Dict:
@@ -257,27 +605,26 @@ def postprocess_split_json_array(response, **kwargs) -> Dict:
     """
     try:
         # Get the JSON response
-        data = response.json()
+        data = _get_json(response)
         
         # Get the array path from kwargs
         array_path = kwargs.get("array_path", None)
         if not array_path:
-            logging.error("No array_path specified for split_json_array processor")
+            logger.error("No array_path specified for split_json_array processor")
             return None
         
         # Navigate to the specified array
         array_data = data
-        path_parts = array_path.split('.')
-        for part in path_parts:
+        for part in _split_path(array_path):
             if part in array_data:
                 array_data = array_data[part]
             else:
-                logging.error(f"Path {array_path} not found in response")
+                logger.error("Path %s not found in response", array_path)
                 return None
         
         # Ensure we have an array
         if not isinstance(array_data, list):
-            logging.error(f"Path {array_path} does not point to an array")
+            logger.error("Path %s does not point to an array", array_path)
             return None
         
         # Add metadata to each item if requested
@@ -289,20 +636,27 @@ def postprocess_split_json_array(response, **kwargs) -> Dict:
                 if isinstance(data, dict) and field in data:
                     parent_info[field] = data[field]
                     
-            # Add parent info and timestamp to each item
+            # Serialize the shared metadata once and splice it into each item's JSON
+            # rather than inserting the same keys into every dict
+            timestamp = datetime.now().isoformat()
+            metadata_json = f',"_parent":{json_dumps_str(parent_info)},"_timestamp":{json_dumps_str(timestamp)}}}'
+            json_lines = []
             for item in array_data:
-                if isinstance(item, dict):
-                    item["_parent"] = parent_info
-                    item["_timestamp"] = datetime.now().isoformat()
-        
-        # Convert each array item to a single-line JSON string
-        json_lines = [json.dumps(item, separators=(',', ':')) for item in array_data]
+                if isinstance(item, dict) and item and "_parent" not in item and "_timestamp" not in item:
+                    json_lines.append(json_dumps_str(item)[:-1] + metadata_json)
+                elif isinstance(item, dict):
+                    json_lines.append(json_dumps_str({**item, "_parent": parent_info, "_timestamp": timestamp}))
+                else:
+                    json_lines.append(json_dumps_str(item))
+        else:
+            # Convert each array item to a single-line JSON string
+            json_lines = [json_dumps_str(item) for item in array_data]
         
         # Return special format to indicate this is an array split output
         return {"__split_json_output": json_lines}
         
     except Exception as e:
-        logging.error(f"Error splitting JSON array: {str(e)}")
+        logger.error("Error splitting JSON array: %s", e)
         return None
 
 def postprocess_transform_keys(response, **kwargs) -> Dict:
@@ -319,62 +673,61 @@ def postprocess_transform_keys(response, **kwargs) -> Dict:
     """
     try:
         # Parse the JSON response
-        data = response.json()
+        data = _get_json(response)
         
         # Get replacements and case transformation
         replacements = kwargs.get('replacements', {})
         case = kwargs.get('case', None)
         
-        # Helper function to transform a single key
-        def transform_key(key):
-            # First apply any direct replacements
-            if key in replacements:
-                key = replacements[key]
-            
-            # Then apply case transformation
-            if case == 'lower':
-                return key.lower()
-            elif case == 'upper':
-                return key.upper()
-            elif case == 'snake':
-                # Convert camelCase or PascalCase to snake_case
-                import re
-                s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', key)
-                return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-            else:
-                return key
+        # Keys repeat across records, so cache each transformed key
+        replacements_items = tuple(replacements.items())
+        transform_key = lambda key: _transform_key_cached(key, case, replacements_items)
         
-        # Helper function to recursively transform keys in a dictionary
+        # Helper function to transform keys in a dictionary and every nested dictionary.
+        # Walks the tree with an explicit stack of (source, destination) pairs instead
+        # of recursing, so deep or wide responses don't pay a call frame per node.
         def transform_dict(d):
             if not isinstance(d, dict):
                 return d
             
-            result = {}
-            for k, v in d.items():
-                new_key = transform_key(k)
-                if isinstance(v, dict):
-                    result[new_key] = transform_dict(v)
-                elif isinstance(v, list):
-                    result[new_key] = [transform_dict(item) if isinstance(item, dict) else item for item in v]
-                else:
-                    result[new_key] = v
-            return result
+            root = {}
+            stack = [(d, root)]
+            while stack:
+                src, dst = stack.pop()
+                for k, v in src.items():
+                    if isinstance(v, dict):
+                        new_dict = {}
+                        stack.append((v, new_dict))
+                        dst[transform_key(k)] = new_dict
+                    elif isinstance(v, list):
+                        new_list = []
+                        for item in v:
+                            if isinstance(item, dict):
+                                new_dict = {}
+                                stack.append((item, new_dict))
+                                new_list.append(new_dict)
+                            else:
+                                new_list.append(item)
+                        dst[transform_key(k)] = new_list
+                    else:
+                        dst[transform_key(k)] = v
+            return root
         
         # Transform the data
         if isinstance(data, dict):
             result = transform_dict(data)
-            logging.info("Transformed keys in response dictionary")
+            logger.info("Transformed keys in response dictionary")
             return result
         elif isinstance(data, list):
             result = [transform_dict(item) if isinstance(item, dict) else item for item in data]
-            logging.info(f"Transformed keys in {len(result)} list items")
+            logger.info("Transformed keys in %s list items", len(result))
             return result
         else:
-            logging.warning("Response data is not a dict or list, cannot transform keys")
+            logger.warning("Response data is not a dict or list, cannot transform keys")
             return data
         
     except Exception as e:
-        logging.error(f"Error transforming keys: {str(e)}")
+        logger.error("Error transforming keys: %s", e)
         return None
 
 def postprocess_extract_nested(response, **kwargs) -> Any:
@@ -391,37 +744,29 @@ def postprocess_extract_nested(response, **kwargs) -> Any:
     """
     try:
         # Parse the JSON response
-        data = response.json()
+        data = _get_json(response)
         
         # Get the path to the nested value
         path = kwargs.get('path', [])
         default = kwargs.get('default', None)
         
-        # Convert string path to list if needed
-        if isinstance(path, str):
-            path = path.split('.')
+        # Convert string path to parts if needed
+        parts = _split_path(path) if isinstance(path, str) else tuple(path)
         
         # Navigate to the value
-        value = data
-        for key in path:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            elif isinstance(value, list) and key.isdigit():
-                index = int(key)
-                if 0 <= index < len(value):
-                    value = value[index]
-                else:
-                    logging.warning(f"Index {index} out of range in path {path}")
-                    return default
+        value, bad_index = _compile_path(parts)(data)
+        if value is _MISSING:
+            if bad_index is not None:
+                logger.warning("Index %s out of range in path %s", bad_index, path)
             else:
-                logging.warning(f"Path {path} not found in response")
-                return default
+                logger.warning("Path %s not found in response", path)
+            return default
         
-        logging.info(f"Extracted value at path {path}")
+        logger.info("Extracted value at path %s", path)
         return value
         
     except Exception as e:
-        logging.error(f"Error extracting nested value: {str(e)}")
+        logger.error("Error extracting nested value: %s", e)
         return None
 
 # =====================
@@ -445,56 +790,70 @@ def output_csv_file(data, endpoint, **kwargs) -> bool:
     """
     try:
         # Create output directory if it doesn't exist
-        directory = kwargs.get('directory')
-        if directory is None:
-            directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
-        os.makedirs(directory, exist_ok=True)
+        directory = kwargs.get('directory') or _DEFAULT_LOG_DIR
+        _ensure_directory(directory)
         
         # Determine filename
         custom_filename = kwargs.get('filename')
         if custom_filename:
             filename = custom_filename
         else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            endpoint_name = endpoint.split('/')[-1].replace('?', '_').replace('&', '_')
+            timestamp = fast_timestamp()
+            endpoint_name = endpoint.rpartition('/')[2].translate(_ENDPOINT_TRANS)
             filename = f"{endpoint_name}_{timestamp}.csv"
         
         file_path = os.path.join(directory, filename)
         
-        # Prepare data for CSV
+        # Prepare data for CSV; lists and other iterables are streamed rather than copied
         if isinstance(data, dict):
-            rows = [data]
-        elif isinstance(data, list):
-            rows = data
+            rows = iter((data,))
+        elif isinstance(data, Iterable) and not isinstance(data, (str, bytes)):
+            rows = iter(data)
         else:
-            logging.error(f"Cannot convert data type {type(data)} to CSV")
+            logger.error("Cannot convert data type %s to CSV", type(data))
             return False
         
+        # Peek at the first row, then put it back in front of the rest
+        first_row = next(rows, None)
+        if first_row is not None:
+            rows = itertools.chain((first_row,), rows)
+        
         # Filter fields if specified
         fields = kwargs.get('fields')
-        if not fields and rows:
+        if not fields and isinstance(first_row, dict):
             # Get all fields from the first row
-            if isinstance(rows[0], dict):
-                fields = list(rows[0].keys())
+            fields = list(first_row.keys())
+        
+        # Nothing to write; skip creating the file
+        if not fields:
+            if first_row is None:
+                logger.warning("No rows to write as CSV for %s", endpoint)
+                return True
+            logger.error("No fields to write as CSV for %s", endpoint)
+            return False
         
         # Write CSV file
+        # Plain csv.writer over a fixed column tuple avoids DictWriter's per-row
+        # field validation; missing fields are written as empty values
+        columns = tuple(fields)
         with open(file_path, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fields, extrasaction='ignore')
+            writer = csv.writer(csvfile)
             
             # Write headers if requested (default: True)
             if kwargs.get('headers', True):
-                writer.writeheader()
+                writer.writerow(columns)
             
             # Write data rows
-            for row in rows:
-                if isinstance(row, dict):
-                    writer.writerow(row)
+            writer.writerows(
+                [row.get(column, '') for column in columns]
+                for row in rows if isinstance(row, dict)
+            )
         
-        logging.info(f"Response from {endpoint} saved as CSV to {file_path}")
+        logger.info("Response from %s saved as CSV to %s", endpoint, file_path)
         return True
         
     except Exception as e:
-        logging.error(f"Error saving response as CSV: {str(e)}")
+        logger.error("Error saving response as CSV: %s", e)
         return False
 
 def output_jsonl_file(data, endpoint, **kwargs) -> bool:
@@ -512,47 +871,44 @@ def output_jsonl_file(data, endpoint, **kwargs) -> bool:
     """
     try:
         # Create output directory if it doesn't exist
-        directory = kwargs.get('directory')
-        if directory is None:
-            directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
-        os.makedirs(directory, exist_ok=True)
+        directory = kwargs.get('directory') or _DEFAULT_LOG_DIR
+        _ensure_directory(directory)
         
         # Determine filename
         custom_filename = kwargs.get('filename')
         if custom_filename:
             filename = custom_filename
         else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            endpoint_name = endpoint.split('/')[-1].replace('?', '_').replace('&', '_')
+            timestamp = fast_timestamp()
+            endpoint_name = endpoint.rpartition('/')[2].translate(_ENDPOINT_TRANS)
             filename = f"{endpoint_name}_{timestamp}.jsonl"
         
         file_path = os.path.join(directory, filename)
         
-        # Prepare data for JSONL
+        # Prepare data for JSONL as encoded lines; lists and other iterables are
+        # serialized lazily while writing rather than materialized up front
         if isinstance(data, dict):
-            lines = [json.dumps(data, separators=(',', ':'))]
-        elif isinstance(data, list):
-            lines = [json.dumps(item, separators=(',', ':')) for item in data]
+            lines = (json_dumps_bytes(data),)
+        elif isinstance(data, Iterable) and not isinstance(data, (str, bytes)):
+            lines = map(json_dumps_bytes, data)
         elif "__split_json_output" in data:
             # Handle special output from split_json_array processor
-            lines = data["__split_json_output"]
+            lines = (line.encode() for line in data["__split_json_output"])
         elif "__flatten_json_output" in data:
             # Handle special output from flatten_json processor
-            lines = [data["__flatten_json_output"]]
+            lines = (data["__flatten_json_output"].encode(),)
         else:
-            logging.error(f"Cannot convert data type {type(data)} to JSONL")
+            logger.error("Cannot convert data type %s to JSONL", type(data))
             return False
         
         # Write JSONL file
-        with open(file_path, 'w') as f:
-            for line in lines:
-                f.write(line + '\n')
+        _write_jsonl_lines(file_path, lines)
         
-        logging.info(f"Response from {endpoint} saved as JSONL to {file_path}")
+        logger.info("Response from %s saved as JSONL to %s", endpoint, file_path)
         return True
         
     except Exception as e:
-        logging.error(f"Error saving response as JSONL: {str(e)}")
+        logger.error("Error saving response as JSONL: %s", e)
         return False
 
 def output_splunk_hec(data, endpoint, **kwargs) -> bool:
@@ -568,19 +924,20 @@ def output_splunk_hec(data, endpoint, **kwargs) -> bool:
         source: Splunk source (default: endpoint URL)
         index: Splunk index (optional)
         verify: SSL verification flag (default: True)
+        batch_size: Maximum number of events per HEC request (default: 500)
+        compress: Gzip-compress larger request bodies (default: True)
+        http2: Send over HTTP/2 using httpx, if installed (default: False)
         
     Returns:
         bool: Success flag
     """
     try:
-        import requests
-        
         # Get Splunk HEC configuration
         hec_url = kwargs.get('hec_url')
         token = kwargs.get('token')
         
         if not hec_url or not token:
-            logging.error("Missing required HEC URL or token")
+            logger.error("Missing required HEC URL or token")
             return False
         
         # Get event parameters
@@ -588,6 +945,18 @@ def output_splunk_hec(data, endpoint, **kwargs) -> bool:
         source = kwargs.get('source', endpoint)
         index = kwargs.get('index')
         verify = kwargs.get('verify', True)
+        batch_size = kwargs.get('batch_size', 500)
+        compress = kwargs.get('compress', True)
+        http2 = kwargs.get('http2', False)
+        
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+            logger.error("Invalid HEC batch_size %r; expected a positive integer", batch_size)
+            return False
+        
+        # Only JSON data (or an iterator of streamed items) can be sent; check before doing any other work
+        if not isinstance(data, (dict, list, Iterator)):
+            logger.error("Cannot send data type %s to Splunk HEC", type(data))
+            return False
         
         # Build event metadata
         event_metadata = {
@@ -598,62 +967,66 @@ def output_splunk_hec(data, endpoint, **kwargs) -> bool:
         if index:
             event_metadata["index"] = index
         
-        # Prepare data for HEC
-        if isinstance(data, (dict, list)):
-            # JSON data
-            events = []
-            
-            if isinstance(data, dict):
-                # Single event
-                event = {
-                    "event": data,
-                    **event_metadata
-                }
-                events.append(event)
-            elif isinstance(data, list):
-                # Multiple events
-                for item in data:
-                    event = {
-                        "event": item,
-                        **event_metadata
-                    }
-                    events.append(event)
-            
-            # Send events to HEC
-            headers = {
+        # JSON data: a dict is a single event, a list or iterator holds multiple events
+        events = [data] if isinstance(data, dict) else data
+        event_count = 0
+        
+        # Serialize the shared metadata once and splice it into every event as
+        # {"event":<item>,<metadata>} rather than building a dict per event.
+        # Joining the serialized items on the text between them builds each
+        # batch body without any per-event concatenation.
+        event_prefix = b'{"event":'
+        metadata_suffix = b"," + json_dumps_bytes(event_metadata)[1:-1] + b"}"
+        event_separator = metadata_suffix + b"\n" + event_prefix
+        
+        # HEC accepts concatenated JSON events, so send them in batches of up to
+        # batch_size per request rather than one round-trip per event. Bodies are
+        # generated lazily so later batches are serialized while earlier ones post.
+        def iter_bodies():
+            nonlocal event_count
+            events_iter = iter(events)
+            while True:
+                batch = list(itertools.islice(events_iter, batch_size))
+                if not batch:
+                    return
+                event_count += len(batch)
+                yield event_prefix + event_separator.join(map(json_dumps_bytes, batch)) + metadata_suffix
+        
+        # Send events to HEC
+        headers = _HEC_HEADERS.get(token)
+        if headers is None:
+            headers = _HEC_HEADERS.setdefault(token, {
                 "Authorization": f"Splunk {token}",
                 "Content-Type": "application/json"
-            }
-            
-            # Batch or single event
-            if len(events) == 1:
-                response = requests.post(
-                    hec_url,
-                    json=events[0],
-                    headers=headers,
-                    verify=verify
-                )
-            else:
-                response = requests.post(
-                    hec_url,
-                    data="\n".join(json.dumps(event) for event in events),
-                    headers=headers,
-                    verify=verify
-                )
-            
-            if response.status_code not in (200, 201):
-                logging.error(f"Error sending to Splunk HEC: {response.status_code} - {response.text}")
-                return False
-            
-            logging.info(f"Sent {len(events)} events to Splunk HEC")
-            return True
-            
+            })
+        post_batch = lambda body: _post_hec_batch(hec_url, body, headers, verify, compress, http2)
+        
+        # Post a lone batch inline; post multiple batches concurrently over the pooled session
+        bodies = iter_bodies()
+        first_body = next(bodies, None)
+        second_body = next(bodies, None) if first_body is not None else None
+        if second_body is None:
+            results = [post_batch(first_body)] if first_body is not None else []
         else:
-            logging.error(f"Cannot send data type {type(data)} to Splunk HEC")
+            # Keep at most HEC_MAX_WORKERS batches in flight so later bodies are only
+            # serialized once there is a worker free to send them
+            results = []
+            pending = set()
+            for body in itertools.chain((first_body, second_body), bodies):
+                if len(pending) >= HEC_MAX_WORKERS:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    results.extend(future.result() for future in done)
+                pending.add(_HEC_POOL.submit(post_batch, body))
+            results.extend(future.result() for future in pending)
+        
+        if not all(results):
             return False
         
+        logger.info("Sent %s events to Splunk HEC", event_count)
+        return True
+        
     except Exception as e:
-        logging.error(f"Error sending to Splunk HEC: {str(e)}")
+        logger.error("Error sending to Splunk HEC: %s", e)
         return False
 
 def register_processors(registry):
@@ -663,20 +1036,23 @@ def register_processors(registry):
     Args:
         registry: Processor registry
     """
-    # Register preprocessors
-    registry.register_preprocessor("update_time_range", preprocess_update_time_range)
-    registry.register_preprocessor("add_headers", preprocess_add_headers)
-    registry.register_preprocessor("template_url", preprocess_template_url)
-    registry.register_preprocessor("pagination_params", preprocess_pagination_params)
-    
-    # Register postprocessors
-    registry.register_postprocessor("filter_response", postprocess_filter_response)
-    registry.register_postprocessor("flatten_json", postprocess_flatten_json)
-    registry.register_postprocessor("split_json_array", postprocess_split_json_array)
-    registry.register_postprocessor("transform_keys", postprocess_transform_keys)
-    registry.register_postprocessor("extract_nested", postprocess_extract_nested)
-    
-    # Register output processors
-    registry.register_output_processor("csv_file", output_csv_file)
-    registry.register_output_processor("jsonl_file", output_jsonl_file)
-    registry.register_output_processor("splunk_hec", output_splunk_hec)
+    registry.register_bulk(
+        preprocessors={
+            "update_time_range": preprocess_update_time_range,
+            "add_headers": preprocess_add_headers,
+            "template_url": preprocess_template_url,
+            "pagination_params": preprocess_pagination_params,
+        },
+        postprocessors={
+            "filter_response": postprocess_filter_response,
+            "flatten_json": postprocess_flatten_json,
+            "split_json_array": postprocess_split_json_array,
+            "transform_keys": postprocess_transform_keys,
+            "extract_nested": postprocess_extract_nested,
+        },
+        output_processors={
+            "csv_file": output_csv_file,
+            "jsonl_file": output_jsonl_file,
+            "splunk_hec": output_splunk_hec,
+        }
+    )